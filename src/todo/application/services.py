@@ -1,16 +1,23 @@
 """Application services / use cases."""
 
-from typing import Literal
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
 from todo.domain.models import (
-    Task,
     validate_title,
     parse_due_date,
     validate_priority,
     parse_tags,
     utc_now,
 )
-from todo.repository.memory_repo import MemoryTaskRepository, SortField
+from todo.repository.memory_repo import MemoryTaskRepository
+
+if TYPE_CHECKING:
+    from typing import Literal
+
+    from todo.domain.models import Task
+    from todo.repository.memory_repo import SortField
 
 
 class TodoService:
@@ -61,32 +68,33 @@ class TodoService:
         """Reopen a task (mark as open). Raises TaskNotFoundError if not found."""
         return self._repo.update(task_id, status="open")
 
-    def update_task(
-        self,
-        task_id: int,
-        title: str | None = None,
-        due: str | None = ...,  # type: ignore[assignment]
-        priority: str | None = ...,  # type: ignore[assignment]
-        tags: str | None = ...,  # type: ignore[assignment]
-    ) -> Task:
-        """Update a task. Validates inputs. Raises ValidationError or TaskNotFoundError."""
-        validated_title = validate_title(title) if title is not None else None
-        due_date = parse_due_date(due) if due is not ... else ...
-        validated_priority = validate_priority(priority) if priority is not ... else ...
-        parsed_tags = parse_tags(tags) if tags is not ... else ...
-
-        return self._repo.update(
-            task_id,
-            title=validated_title,
-            due_date=due_date,  # type: ignore[arg-type]
-            priority=validated_priority,  # type: ignore[arg-type]
-            tags=parsed_tags,  # type: ignore[arg-type]
-        )
+    def update_task(self, task_id: int, **fields: str | None) -> Task:
+        """Update a task from the fields the caller actually supplied.
+
+        Accepts title, due, priority and tags keywords. Absent keys leave
+        the stored value untouched; an explicit None (or empty tags) clears
+        the optional fields. Raises ValidationError or TaskNotFoundError.
+        """
+        changes: dict[str, object] = {}
+        if fields.get("title") is not None:
+            changes["title"] = validate_title(fields["title"])
+        if "due" in fields:
+            changes["due_date"] = parse_due_date(fields["due"])
+        if "priority" in fields:
+            changes["priority"] = validate_priority(fields["priority"])
+        if "tags" in fields:
+            changes["tags"] = parse_tags(fields["tags"])
+
+        return self._repo.update(task_id, **changes)
 
     def delete_task(self, task_id: int) -> None:
         """Delete a task. Raises TaskNotFoundError if not found."""
         self._repo.delete(task_id)
 
+    def count_done(self) -> int:
+        """Return the number of completed tasks."""
+        return self._repo.count_done()
+
     def clear_done(self) -> int:
         """Clear all completed tasks. Returns count of removed tasks."""
         return self._repo.clear_done()
@@ -1,12 +1,13 @@
 """Command-line interface for the Todo application."""
 
 import argparse
+import functools
 import sys
-from typing import NoReturn
+from typing import TYPE_CHECKING
 
-from todo.application.services import TodoService
-from todo.domain.errors import ValidationError, TaskNotFoundError
-from todo.domain.models import Task
+if TYPE_CHECKING:
+    from todo.application.services import TodoService
+    from todo.domain.models import Task
 
 
 EXIT_SUCCESS = 0
@@ -15,34 +16,74 @@ EXIT_NOT_FOUND = 3
 
 
 # Global service instance (in-memory, resets on process restart)
-_service: TodoService | None = None
+_service: "TodoService | None" = None
 
 
-def get_service() -> TodoService:
+def get_service() -> "TodoService":
     """Get or create the global service instance."""
     global _service
     if _service is None:
+        from todo.application.services import TodoService
+
         _service = TodoService()
     return _service
 
 
-def format_task_line(task: Task) -> str:
-    """Format a task as a single line for display."""
-    status = "[x]" if task.status == "done" else "[ ]"
-    priority = task.priority.upper() if task.priority else "-"
-    due = str(task.due_date) if task.due_date else "-"
-    tags = ",".join(task.tags) if task.tags else "-"
-    return f"{task.id:>3} {status} {priority:<4} {due:<10} {task.title} [{tags}]"
+_TABLE_HEADER = f"{'ID':>3} {'STS':<3} {'PRI':<4} {'DUE':<10} {'TITLE':<30} TAGS"
+_TABLE_SEPARATOR = "-" * 70
+
+
+def format_task_line(task: "Task") -> str:
+    """Format a task as a single line for display.
+
+    The rendered line is memoized on the task against its revision, so
+    repeated list renders only re-format rows that actually changed.
+    """
+    cached = task._line
+    if cached is not None and cached[0] == task._rev:
+        return cached[1]
+
+    # Assembled from pre-padded columns; joining plain strings is cheaper
+    # than interpreting six format specs per row.
+    line = "".join(
+        (
+            str(task.id).rjust(3),
+            " [x] " if task.status == "done" else " [ ] ",
+            (task.priority.upper() if task.priority else "-").ljust(4),
+            " ",
+            (str(task.due_date) if task.due_date else "-").ljust(10),
+            " ",
+            task.title,
+            " [",
+            ",".join(task.tags) if task.tags else "-",
+            "]",
+        )
+    )
+    task._line = (task._rev, line)
+    return line
+
+
+def print_task_table(tasks: "list[Task]", stream) -> None:
+    """Write the task table to stream line by line.
+
+    Streams rows with writelines instead of materializing the whole
+    table as one joined string first.
+    """
+    if not tasks:
+        stream.write("No tasks found.\n")
+        return
 
+    stream.write(_TABLE_HEADER + "\n")
+    stream.write(_TABLE_SEPARATOR + "\n")
+    stream.writelines(format_task_line(task) + "\n" for task in tasks)
 
-def format_task_table(tasks: list[Task]) -> str:
+
+def format_task_table(tasks: "list[Task]") -> str:
     """Format a list of tasks as a table."""
     if not tasks:
         return "No tasks found."
 
-    header = f"{'ID':>3} {'STS':<3} {'PRI':<4} {'DUE':<10} {'TITLE':<30} TAGS"
-    separator = "-" * 70
-    lines = [header, separator]
+    lines = [_TABLE_HEADER, _TABLE_SEPARATOR]
     for task in tasks:
         lines.append(format_task_line(task))
     return "\n".join(lines)
@@ -69,7 +110,7 @@ def cmd_list(args: argparse.Namespace) -> int:
         tag=args.tag,
         sort=args.sort,
     )
-    print(format_task_table(tasks))
+    print_task_table(tasks, sys.stdout)
     return EXIT_SUCCESS
 
 
@@ -92,13 +133,16 @@ def cmd_reopen(args: argparse.Namespace) -> int:
 def cmd_update(args: argparse.Namespace) -> int:
     """Handle the 'update' command."""
     service = get_service()
-    task = service.update_task(
-        task_id=args.id,
-        title=args.title,
-        due=args.due if hasattr(args, "due") and args.due is not None else ...,
-        priority=args.priority if hasattr(args, "priority") and args.priority is not None else ...,
-        tags=args.tag if hasattr(args, "tag") and args.tag is not None else ...,
-    )
+    fields: dict[str, str] = {}
+    if args.title is not None:
+        fields["title"] = args.title
+    if args.due is not None:
+        fields["due"] = args.due
+    if args.priority is not None:
+        fields["priority"] = args.priority
+    if args.tag is not None:
+        fields["tags"] = args.tag
+    task = service.update_task(args.id, **fields)
     print(f"Updated task {task.id}: {task.title}")
     return EXIT_SUCCESS
 
@@ -119,8 +163,13 @@ def cmd_clear_done(args: argparse.Namespace) -> int:
     return EXIT_SUCCESS
 
 
+@functools.lru_cache(maxsize=1)
 def create_parser() -> argparse.ArgumentParser:
-    """Create and configure the argument parser."""
+    """Create and configure the argument parser.
+
+    Cached: parse_args leaves the parser untouched, so repeated main()
+    calls (tests, a future shell passthrough) reuse one parser tree.
+    """
     parser = argparse.ArgumentParser(
         prog="todo",
         description="In-memory Todo CLI application",
@@ -208,9 +257,13 @@ def cmd_shell(args: argparse.Namespace) -> int:
 def main(argv: list[str] | None = None) -> int:
     """Main entry point for the CLI."""
     parser = create_parser()
+    args = parser.parse_args(argv)
+
+    # Deferred so that --help, --version and usage errors never pay the
+    # cost of importing the application and domain layers.
+    from todo.domain.errors import ValidationError, TaskNotFoundError
 
     try:
-        args = parser.parse_args(argv)
         return args.func(args)
     except ValidationError as e:
         print(f"Error: {e.message}", file=sys.stderr)
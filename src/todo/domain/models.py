@@ -1,17 +1,35 @@
 """Domain models and validation."""
 
+from __future__ import annotations
+
+import sys
 from dataclasses import dataclass, field
 from datetime import date, datetime, timezone
-from typing import Literal
+from typing import TYPE_CHECKING
 
 from .errors import ValidationError
 
 
-Status = Literal["open", "done"]
-Priority = Literal["low", "med", "high"]
+# Literal aliases are for the type checker only; evaluating them at import
+# builds typing._GenericAlias objects every process start for no runtime
+# benefit, so the runtime sees plain str.
+if TYPE_CHECKING:
+    from typing import Literal
+
+    Status = Literal["open", "done"]
+    Priority = Literal["low", "med", "high"]
+else:
+    Status = str
+    Priority = str
+
+_VALID_PRIORITIES: frozenset[str] = frozenset({"low", "med", "high"})
+_VALID_PRIORITIES_MSG = "low, med, high"
+
+# Sort rank per priority: high > med > low, untagged last.
+_PRIO_ORDER: dict[str | None, int] = {"high": 0, "med": 1, "low": 2, None: 3}
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Represents a Todo task."""
 
@@ -22,6 +40,46 @@ class Task:
     due_date: date | None = None
     priority: Priority | None = None
     tags: list[str] = field(default_factory=list)
+    # Revision counter bumped by the repository on every mutation; lets
+    # display caches tell whether a rendered view of this task is stale.
+    _rev: int = field(default=0, init=False, repr=False, compare=False)
+    # (revision, rendered line) pair maintained by the CLI formatter.
+    # Riding on the task keeps the cache scoped to its repository and
+    # makes eviction automatic when the task is deleted.
+    _line: tuple[int, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Formatted created_at string, filled in lazily by the detail view.
+    # created_at never mutates, so no revision check is needed.
+    _created_str: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Precomputed sort-key tuples, refreshed by the repository whenever the
+    # task mutates, so sorting reads one attribute per comparison instead
+    # of rebuilding key tuples in a lambda N log N times.
+    _created_key: tuple[datetime, int] = field(init=False, repr=False, compare=False)
+    _due_key: tuple[int, date, int] = field(init=False, repr=False, compare=False)
+    _prio_key: tuple[int, int] = field(init=False, repr=False, compare=False)
+    # Lowercased tags, computed once at write time so case-insensitive
+    # lookups never re-lower the same strings per query.
+    _tags_lower: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.refresh_sort_keys()
+        self.refresh_tags_lower()
+
+    def refresh_tags_lower(self) -> None:
+        """Recompute the cached lowercased tag tuple after tags change."""
+        self._tags_lower = tuple(t.lower() for t in self.tags)
+
+    def refresh_sort_keys(self) -> None:
+        """Recompute the cached sort-key tuples from the current fields."""
+        self._created_key = (self.created_at, self.id)
+        if self.due_date is not None:
+            self._due_key = (0, self.due_date, self.id)
+        else:
+            self._due_key = (1, date.max, self.id)
+        self._prio_key = (_PRIO_ORDER[self.priority], self.id)
 
 
 def validate_title(title: str) -> str:
@@ -36,30 +94,47 @@ def parse_due_date(due_str: str | None) -> date | None:
     """Parse due date from YYYY-MM-DD string. Raises ValidationError if invalid."""
     if due_str is None:
         return None
-    try:
-        return date.fromisoformat(due_str)
-    except ValueError:
-        raise ValidationError(f"Invalid date format: {due_str}. Expected YYYY-MM-DD")
+    # Hand-rolled parse of the one accepted grammar; avoids the generality
+    # (and bad-input exception cost) of date.fromisoformat.
+    if (
+        len(due_str) == 10
+        and due_str[4] == "-"
+        and due_str[7] == "-"
+        and due_str[:4].isdigit()
+        and due_str[5:7].isdigit()
+        and due_str[8:10].isdigit()
+    ):
+        try:
+            return date(int(due_str[:4]), int(due_str[5:7]), int(due_str[8:10]))
+        except ValueError:
+            pass
+    raise ValidationError(f"Invalid date format: {due_str}. Expected YYYY-MM-DD")
 
 
 def validate_priority(priority_str: str | None) -> Priority | None:
     """Validate priority value. Raises ValidationError if invalid."""
     if priority_str is None:
         return None
-    valid = ("low", "med", "high")
-    if priority_str not in valid:
+    if priority_str not in _VALID_PRIORITIES:
         raise ValidationError(
-            f"Invalid priority: {priority_str}. Must be one of: {', '.join(valid)}"
+            f"Invalid priority: {priority_str}. Must be one of: {_VALID_PRIORITIES_MSG}"
         )
-    return priority_str  # type: ignore[return-value]
+    # Interned so every task holding "high" shares one str object and
+    # equality checks hit the pointer-comparison fast path.
+    return sys.intern(priority_str)  # type: ignore[return-value]
 
 
 def parse_tags(tags_str: str | None) -> list[str]:
     """Parse comma-separated tags into a normalized list."""
-    if tags_str is None:
+    if not tags_str:
         return []
-    tags = [t.strip() for t in tags_str.split(",")]
-    return [t for t in tags if t]
+    if "," not in tags_str:
+        # Common case: a single tag, no split needed.
+        tag = tags_str.strip()
+        return [sys.intern(tag)] if tag else []
+    # Interned: the same tag repeated across many tasks collapses to a
+    # single str object instead of one allocation per task.
+    return [sys.intern(s) for s in (t.strip() for t in tags_str.split(",")) if s]
 
 
 def utc_now() -> datetime:
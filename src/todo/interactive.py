@@ -2,7 +2,7 @@
 
 import shlex
 import sys
-from typing import TextIO
+from typing import Callable, TextIO
 
 from todo.application.services import TodoService
 from todo.domain.errors import ValidationError, TaskNotFoundError
@@ -10,6 +10,11 @@ from todo.domain.models import Task
 from todo.cli import format_task_table
 
 
+# Valid values for list options, precomputed for O(1) membership checks
+_VALID_STATUSES: frozenset[str] = frozenset({"all", "open", "done"})
+_VALID_SORTS: frozenset[str] = frozenset({"created", "due", "priority"})
+
+
 # Command aliases mapping
 ALIASES: dict[str, str] = {
     "ls": "list",
@@ -50,7 +55,10 @@ def format_task_detail(task: Task) -> str:
     priority = task.priority if task.priority else "none"
     due = str(task.due_date) if task.due_date else "none"
     tags = ", ".join(task.tags) if task.tags else "none"
-    created = task.created_at.strftime("%Y-%m-%d %H:%M:%S UTC")
+    created = task._created_str
+    if created is None:
+        created = task.created_at.strftime("%Y-%m-%d %H:%M:%S UTC")
+        task._created_str = created
 
     return f"""\
 Task #{task.id}
@@ -62,6 +70,23 @@ Task #{task.id}
   Created:  {created}"""
 
 
+# Sentinel dispatch value meaning "exit the shell"; quit has no handler
+# body, so execute() special-cases this one marker.
+_QUIT = object()
+
+
+def _tokenize(line: str) -> list[str]:
+    """Split a command line into tokens.
+
+    Unquoted lines (the overwhelmingly common case) take a plain
+    str.split fast path; anything containing a quote falls back to
+    shlex so existing quoting behavior is preserved.
+    """
+    if '"' not in line and "'" not in line:
+        return line.split()
+    return shlex.split(line)
+
+
 class PromptCancelled(Exception):
     """Raised when user cancels a prompt."""
 
@@ -80,13 +105,23 @@ class InteractiveShell:
         self.service = service or TodoService()
         self.input_stream = input_stream or sys.stdin
         self.output_stream = output_stream or sys.stdout
+        # Pending output lines; batched into one stream write per flush so
+        # a large list render costs one syscall instead of one per row.
+        self._buf: list[str] = []
 
     def print(self, message: str = "") -> None:
-        """Print to output stream."""
-        print(message, file=self.output_stream)
+        """Queue a line for the output stream."""
+        self._buf.append(f"{message}\n")
+
+    def _flush(self) -> None:
+        """Write all buffered output in a single stream write."""
+        if self._buf:
+            self.output_stream.write("".join(self._buf))
+            self._buf.clear()
 
     def prompt(self, message: str) -> str:
         """Prompt for input. Raises PromptCancelled on EOF/interrupt."""
+        self._flush()
         try:
             if self.input_stream == sys.stdin:
                 return input(message)
@@ -112,17 +147,28 @@ class InteractiveShell:
         self.print("Todo Interactive Mode (type 'help' or 'quit')")
         self.print("-" * 45)
 
+        # Pick the read strategy once instead of re-checking the stream
+        # kind on every iteration. Returns None on EOF for file input.
+        if self.input_stream is sys.stdin:
+            def read_line() -> str | None:
+                return input("todo> ")
+        else:
+            def read_line() -> str | None:
+                line = self.input_stream.readline()
+                if not line:  # EOF
+                    return None
+                return line.rstrip("\n")
+
         while True:
             try:
-                if self.input_stream == sys.stdin:
-                    line = input("todo> ")
-                else:
-                    line = self.input_stream.readline()
-                    if not line:  # EOF
-                        break
-                    line = line.rstrip("\n")
+                # Everything the previous command printed goes out in one
+                # write before we block on the next line of input.
+                self._flush()
+                raw = read_line()
+                if raw is None:
+                    break
 
-                line = line.strip()
+                line = raw.strip()
                 if not line:
                     continue
 
@@ -137,10 +183,12 @@ class InteractiveShell:
                 self.print("\nGoodbye!")
                 break
 
+        self._flush()
+
     def execute(self, line: str) -> bool:
         """Execute a single command. Returns True if shell should exit."""
         try:
-            tokens = shlex.split(line)
+            tokens = _tokenize(line)
         except ValueError as e:
             self.print(f"Error: Invalid input - {e}")
             return False
@@ -151,24 +199,17 @@ class InteractiveShell:
         cmd = tokens[0].lower()
         args = tokens[1:]
 
-        # Resolve aliases
-        cmd = ALIASES.get(cmd, cmd)
-
-        if cmd in ("quit", "exit"):
-            self.print("Goodbye!")
-            return True
-
-        if cmd == "help":
-            self.print(HELP_TEXT)
-            return False
-
-        handler = getattr(self, f"cmd_{cmd}", None)
+        handler = _DISPATCH.get(cmd)
         if handler is None:
             self.print(f"Unknown command: {cmd}. Type 'help' for options.")
             return False
 
+        if handler is _QUIT:
+            self.print("Goodbye!")
+            return True
+
         try:
-            handler(args)
+            handler(self, args)  # type: ignore[operator]
         except ValidationError as e:
             self.print(f"Error: {e.message}")
         except TaskNotFoundError as e:
@@ -178,21 +219,21 @@ class InteractiveShell:
 
         return False
 
+    def _print_help(self, args: list[str]) -> None:
+        """Handle help command."""
+        self.print(HELP_TEXT)
+
     def cmd_add(self, args: list[str]) -> None:
         """Handle add command."""
-        opts = self._parse_options(args)
+        opts, positionals = self._split_args(args)
 
-        # Check for -f/--force (not used for add, but parse it)
-        # Extract title from non-option args
-        non_option_args = self._get_non_option_args(args)
-
-        if not non_option_args:
+        if not positionals:
             # Guided prompt mode
             title = self.prompt("Title: ").strip()
             if not title:
                 raise ValidationError("Title cannot be empty")
         else:
-            title = non_option_args[0]
+            title = positionals[0]
 
         task = self.service.add_task(
             title=title,
@@ -204,15 +245,15 @@ class InteractiveShell:
 
     def cmd_list(self, args: list[str]) -> None:
         """Handle list command."""
-        opts = self._parse_options(args)
+        opts, _ = self._split_args(args)
 
         status = opts.get("status", "all")
-        if status not in ("all", "open", "done"):
+        if status not in _VALID_STATUSES:
             self.print(f"Error: Invalid status '{status}'. Use: all, open, done")
             return
 
         sort = opts.get("sort", "created")
-        if sort not in ("created", "due", "priority"):
+        if sort not in _VALID_SORTS:
             self.print(f"Error: Invalid sort '{sort}'. Use: created, due, priority")
             return
 
@@ -256,7 +297,7 @@ class InteractiveShell:
         if task_id is None:
             return
 
-        opts = self._parse_options(args[1:])
+        opts, _ = self._split_args(args[1:])
 
         # Check if any update flags were provided
         has_update_flags = any(
@@ -297,13 +338,16 @@ class InteractiveShell:
             elif new_tags == "none" and task.tags:
                 opts["tag"] = ""
 
-        updated_task = self.service.update_task(
-            task_id=task_id,
-            title=opts.get("title"),
-            due=opts.get("due") if "due" in opts else ...,  # type: ignore[arg-type]
-            priority=opts.get("priority") if "priority" in opts else ...,  # type: ignore[arg-type]
-            tags=opts.get("tag") if "tag" in opts else ...,  # type: ignore[arg-type]
-        )
+        fields: dict[str, str | None] = {}
+        if opts.get("title") is not None:
+            fields["title"] = opts["title"]
+        if "due" in opts:
+            fields["due"] = opts["due"]
+        if "priority" in opts:
+            fields["priority"] = opts["priority"]
+        if "tag" in opts:
+            fields["tags"] = opts["tag"]
+        updated_task = self.service.update_task(task_id, **fields)
         self.print(f"Updated task {updated_task.id}: {updated_task.title}")
 
     def cmd_delete(self, args: list[str]) -> None:
@@ -312,7 +356,7 @@ class InteractiveShell:
         if task_id is None:
             return
 
-        opts = self._parse_options(args[1:])
+        opts, _ = self._split_args(args[1:])
         force = "f" in opts or "force" in opts
 
         # Get task first to show title in confirmation
@@ -328,12 +372,11 @@ class InteractiveShell:
 
     def cmd_clear(self, args: list[str]) -> None:
         """Handle clear command (clear-done)."""
-        opts = self._parse_options(args)
+        opts, _ = self._split_args(args)
         force = "f" in opts or "force" in opts
 
         # Get count of done tasks first
-        done_tasks = self.service.list_tasks(status="done")
-        count = len(done_tasks)
+        count = self.service.count_done()
 
         if count == 0:
             self.print("No completed tasks to clear.")
@@ -359,9 +402,10 @@ class InteractiveShell:
             self.print(f"Error: '{args[0]}' is not a valid task ID")
             return None
 
-    def _parse_options(self, args: list[str]) -> dict[str, str]:
-        """Parse --key value and -k pairs from args."""
+    def _split_args(self, args: list[str]) -> tuple[dict[str, str], list[str]]:
+        """Split args into (--key value / -k options, positionals) in one pass."""
         opts: dict[str, str] = {}
+        positionals: list[str] = []
         i = 0
         while i < len(args):
             if args[i].startswith("--"):
@@ -378,27 +422,30 @@ class InteractiveShell:
                 opts[key] = ""
                 i += 1
             else:
+                positionals.append(args[i])
                 i += 1
-        return opts
-
-    def _get_non_option_args(self, args: list[str]) -> list[str]:
-        """Get positional (non-option) arguments."""
-        result = []
-        i = 0
-        while i < len(args):
-            if args[i].startswith("--"):
-                # Skip --key value pair
-                if i + 1 < len(args) and not args[i + 1].startswith("-"):
-                    i += 2
-                else:
-                    i += 1
-            elif args[i].startswith("-") and len(args[i]) == 2:
-                # Skip short flag
-                i += 1
-            else:
-                result.append(args[i])
-                i += 1
-        return result
+        return opts, positionals
+
+
+# Command dispatch table (aliases, help and quit included), built once at
+# module scope so constructing a shell does no per-instance table work.
+# Values are unbound methods; execute() passes the instance explicitly.
+_DISPATCH: dict[str, Callable[[InteractiveShell, list[str]], None] | object] = {
+    "add": InteractiveShell.cmd_add,
+    "list": InteractiveShell.cmd_list,
+    "show": InteractiveShell.cmd_show,
+    "done": InteractiveShell.cmd_done,
+    "reopen": InteractiveShell.cmd_reopen,
+    "update": InteractiveShell.cmd_update,
+    "delete": InteractiveShell.cmd_delete,
+    "clear": InteractiveShell.cmd_clear,
+    "help": InteractiveShell._print_help,
+    "quit": _QUIT,
+    "exit": _QUIT,
+}
+for _alias, _target in ALIASES.items():
+    if _target in _DISPATCH:
+        _DISPATCH[_alias] = _DISPATCH[_target]
 
 
 def run_shell() -> int:
@@ -1,21 +1,58 @@
 """In-memory task repository."""
 
-from datetime import date, datetime
-from typing import Literal
+from __future__ import annotations
 
-from todo.domain.models import Task, Priority, Status
+import sys
+from bisect import bisect_left, insort
+from collections import defaultdict
+from operator import attrgetter
+from typing import TYPE_CHECKING
+
+from todo.domain.models import Task
 from todo.domain.errors import TaskNotFoundError
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from datetime import date, datetime
+    from typing import Literal
+
+    from todo.domain.models import Priority, Status
+
+    SortField = Literal["created", "due", "priority"]
+else:
+    # Checker-only alias; see models.py for the rationale.
+    SortField = str
 
-SortField = Literal["created", "due", "priority"]
+# Sort key functions hoisted to module scope; attrgetter objects are
+# reusable and run in C, so building them per call was pure overhead.
+_KEY_CREATED = attrgetter("_created_key")
+_KEY_DUE = attrgetter("_due_key")
+_KEY_PRIO = attrgetter("_prio_key")
 
 
 class MemoryTaskRepository:
     """In-memory storage for tasks. Data is lost when the process exits."""
 
     def __init__(self) -> None:
-        self._tasks: dict[int, Task] = {}
-        self._next_id: int = 1
+        # Dense storage: task id is its index (slot 0 unused, ids start at
+        # 1 and are never reused). Deleted slots hold None; lookups are a
+        # plain list index with no hashing.
+        self._tasks: list[Task | None] = [None]
+        # Secondary index: status -> ids of tasks in that status. Keeps
+        # status filtering, clear_done and count_done proportional to the
+        # matching tasks instead of scanning the whole store.
+        self._by_status: dict[Status, set[int]] = {"open": set(), "done": set()}
+        # Inverted index: lowercased tag -> ids of tasks carrying it, so
+        # the case-insensitive tag filter is a dict lookup instead of
+        # lowercasing every tag of every task per query.
+        self._by_tag: dict[str, set[int]] = defaultdict(set)
+        # Memoized list_all results keyed by (status, tag, sort); cleared
+        # on any mutation. The interactive shell calls list with the same
+        # arguments over and over, so repeat queries skip filter and sort.
+        self._list_cache: dict[tuple[str, str | None, str], list[Task]] = {}
+        # Tasks kept permanently ordered by _created_key; insertions go
+        # through bisect so the default unfiltered listing never re-sorts.
+        self._sorted_created: list[Task] = []
 
     def add(
         self,
@@ -27,7 +64,7 @@ class MemoryTaskRepository:
     ) -> Task:
         """Add a new task and return it."""
         task = Task(
-            id=self._next_id,
+            id=len(self._tasks),
             title=title,
             status="open",
             created_at=created_at,
@@ -35,56 +72,115 @@ class MemoryTaskRepository:
             priority=priority,
             tags=tags or [],
         )
-        self._tasks[self._next_id] = task
-        self._next_id += 1
+        self._tasks.append(task)
+        self._by_status["open"].add(task.id)
+        self._index_tags(task)
+        insort(self._sorted_created, task, key=_KEY_CREATED)
+        self._list_cache.clear()
         return task
 
-    def get(self, task_id: int) -> Task:
-        """Get a task by ID. Raises TaskNotFoundError if not found."""
-        if task_id not in self._tasks:
-            raise TaskNotFoundError(task_id)
-        return self._tasks[task_id]
+    def _drop_sorted(self, task: Task) -> None:
+        """Remove a task from the created-order list via binary search."""
+        i = bisect_left(self._sorted_created, task._created_key, key=_KEY_CREATED)
+        # _created_key tie-breaks on id, so the match (if present) is exact.
+        if i < len(self._sorted_created) and self._sorted_created[i] is task:
+            del self._sorted_created[i]
 
-    def update(
-        self,
-        task_id: int,
-        title: str | None = None,
-        status: Status | None = None,
-        due_date: date | None = ...,  # type: ignore[assignment]
-        priority: Priority | None = ...,  # type: ignore[assignment]
-        tags: list[str] | None = ...,  # type: ignore[assignment]
-    ) -> Task:
-        """Update a task. Raises TaskNotFoundError if not found.
+    def _index_tags(self, task: Task) -> None:
+        """Add a task's tags to the inverted tag index."""
+        task.refresh_tags_lower()
+        for key in task._tags_lower:
+            self._by_tag[key].add(task.id)
+
+    def _deindex_tags(self, task: Task) -> None:
+        """Remove a task's tags from the inverted tag index.
 
-        Uses sentinel values (...) to distinguish between None and 'not provided'.
+        Uses the cached lowercased tuple, so removal never re-lowers the
+        task's old tags.
         """
-        task = self.get(task_id)
+        for key in task._tags_lower:
+            ids = self._by_tag.get(key)
+            if ids is not None:
+                ids.discard(task.id)
+                if not ids:
+                    del self._by_tag[key]
 
-        if title is not None:
-            task.title = title
-        if status is not None:
-            task.status = status
-        if due_date is not ...:
-            task.due_date = due_date
-        if priority is not ...:
-            task.priority = priority
-        if tags is not ...:
-            task.tags = tags or []
+    def get(self, task_id: int) -> Task:
+        """Get a task by ID. Raises TaskNotFoundError if not found."""
+        # Single slot read on the hot path; the error (and its message
+        # formatting) is only constructed on a miss.
+        if 0 < task_id < len(self._tasks) and (task := self._tasks[task_id]) is not None:
+            return task
+        raise TaskNotFoundError(task_id)
+
+    def update(self, task_id: int, **changes: object) -> Task:
+        """Update a task from the supplied field values.
+
+        Accepts title, status, due_date, priority and tags keywords; only
+        keys actually passed are touched, so unchanged fields cost no
+        branches. Raises TaskNotFoundError if not found.
+        """
+        task = self.get(task_id)
 
+        # Keep the secondary indexes in step with the fields they mirror.
+        if "status" in changes:
+            # Interned at the write boundary so stored statuses are always
+            # the canonical str objects and comparisons take the identity
+            # fast path, wherever the caller's string came from.
+            changes["status"] = sys.intern(changes["status"])  # type: ignore[arg-type]
+            if changes["status"] != task.status:
+                self._by_status[task.status].discard(task.id)
+                self._by_status[changes["status"]].add(task.id)  # type: ignore[index]
+        if "tags" in changes:
+            self._deindex_tags(task)
+            changes["tags"] = changes["tags"] or []
+        if "created_at" in changes:
+            self._drop_sorted(task)
+
+        for name, value in changes.items():
+            setattr(task, name, value)
+
+        if "tags" in changes:
+            self._index_tags(task)
+
+        task.refresh_sort_keys()
+        if "created_at" in changes:
+            insort(self._sorted_created, task, key=_KEY_CREATED)
+        task._rev += 1
+        self._list_cache.clear()
         return task
 
     def delete(self, task_id: int) -> None:
         """Delete a task. Raises TaskNotFoundError if not found."""
-        if task_id not in self._tasks:
-            raise TaskNotFoundError(task_id)
-        del self._tasks[task_id]
+        task = self.get(task_id)
+        self._by_status[task.status].discard(task_id)
+        self._deindex_tags(task)
+        self._drop_sorted(task)
+        self._tasks[task_id] = None
+        self._list_cache.clear()
 
     def clear_done(self) -> int:
         """Remove all tasks with status 'done'. Returns count of removed tasks."""
-        done_ids = [tid for tid, task in self._tasks.items() if task.status == "done"]
+        # Iterating the index set directly is safe: the loop only deletes
+        # from the task store, and the set is cleared in one go afterwards.
+        done_ids = self._by_status["done"]
+        count = len(done_ids)
+        tasks = self._tasks
         for tid in done_ids:
-            del self._tasks[tid]
-        return len(done_ids)
+            self._deindex_tags(tasks[tid])  # type: ignore[arg-type]
+            tasks[tid] = None
+        done_ids.clear()
+        if count:
+            # One filtering pass beats k individual O(N) list deletions.
+            self._sorted_created = [
+                t for t in self._sorted_created if tasks[t.id] is not None
+            ]
+        self._list_cache.clear()
+        return count
+
+    def count_done(self) -> int:
+        """Return the number of tasks with status 'done' without scanning."""
+        return len(self._by_status["done"])
 
     def list_all(
         self,
@@ -93,38 +189,63 @@ class MemoryTaskRepository:
         sort: SortField = "created",
     ) -> list[Task]:
         """List tasks with optional filtering and sorting."""
-        tasks = list(self._tasks.values())
-
-        # Filter by status
-        if status != "all":
-            tasks = [t for t in tasks if t.status == status]
-
-        # Filter by tag
-        if tag is not None:
-            tag_lower = tag.lower()
-            tasks = [t for t in tasks if any(tg.lower() == tag_lower for tg in t.tags)]
+        key = (status, tag.lower() if tag is not None else None, sort)
+        cached = self._list_cache.get(key)
+        if cached is not None:
+            return cached.copy()
+
+        # Unfiltered created-order listing (the default) comes straight
+        # from the persistently sorted list with no sort at all.
+        if sort == "created" and status == "all" and tag is None:
+            tasks = self._sorted_created.copy()
+            self._list_cache[key] = tasks
+            return tasks.copy()
+
+        # Resolve both filters against their indexes first, then touch only
+        # the matching tasks. Intersecting the id sets (which starts from
+        # the smaller operand) applies the more selective filter first.
+        s_ids = self._by_status[status] if status != "all" else None
+        t_ids = self._by_tag.get(tag.lower(), frozenset()) if tag is not None else None
+
+        if s_ids is not None and t_ids is not None:
+            tasks = [self._tasks[tid] for tid in s_ids & t_ids]
+        elif t_ids is not None:
+            tasks = [self._tasks[tid] for tid in t_ids]
+        elif s_ids is not None:
+            tasks = [self._tasks[tid] for tid in s_ids]
+        else:
+            # No filters: hand _sort_tasks a generator so sorted() consumes
+            # the scan directly instead of an intermediate list being built
+            # first and thrown away.
+            tasks = (t for t in self._tasks if t is not None)
 
         # Sort
         tasks = self._sort_tasks(tasks, sort)
 
-        return tasks
+        self._list_cache[key] = tasks
+        # Hand out a copy so callers can't mutate the cached list.
+        return tasks.copy()
+
+    def _sort_tasks(self, tasks: Iterable[Task], sort: SortField) -> list[Task]:
+        """Sort tasks according to the specified field with deterministic tie-breaking.
+
+        Accepts any iterable; sorted() materializes it. Tasks carry
+        precomputed key tuples (see Task.refresh_sort_keys), so each
+        comparison costs a single attribute read.
+        """
+        if isinstance(tasks, list) and len(tasks) < 2:
+            # Nothing to order; skip the sorted() allocation and key calls.
+            return tasks
 
-    def _sort_tasks(self, tasks: list[Task], sort: SortField) -> list[Task]:
-        """Sort tasks according to the specified field with deterministic tie-breaking."""
         if sort == "created":
-            return sorted(tasks, key=lambda t: (t.created_at, t.id))
+            return sorted(tasks, key=_KEY_CREATED)
 
         if sort == "due":
             # Tasks with due_date first (sorted asc), then no-due tasks, tie-break by id
-            def due_key(t: Task) -> tuple:
-                if t.due_date is not None:
-                    return (0, t.due_date, t.id)
-                return (1, date.max, t.id)
-            return sorted(tasks, key=due_key)
+            return sorted(tasks, key=_KEY_DUE)
 
         if sort == "priority":
             # high > med > low, None last, tie-break by id
-            priority_order = {"high": 0, "med": 1, "low": 2, None: 3}
-            return sorted(tasks, key=lambda t: (priority_order[t.priority], t.id))
+            return sorted(tasks, key=_KEY_PRIO)
 
-        return tasks
+        return list(tasks)
@@ -7,21 +7,26 @@ from todo.interactive import InteractiveShell, ALIASES, format_task_detail
 from todo.application.services import TodoService
 
 
-class TestInteractiveShell:
-    def create_shell(self, commands: list[str]) -> tuple[InteractiveShell, io.StringIO]:
-        """Create a shell with predefined input and capture output."""
+@pytest.fixture
+def make_shell():
+    """Build a shell wired to scripted input and captured output."""
+
+    def _make(commands: list[str]) -> tuple[InteractiveShell, io.StringIO]:
         input_stream = io.StringIO("\n".join(commands) + "\n")
         output_stream = io.StringIO()
-        service = TodoService()
         shell = InteractiveShell(
-            service=service,
+            service=TodoService(),
             input_stream=input_stream,
             output_stream=output_stream,
         )
         return shell, output_stream
 
-    def test_help_command(self):
-        shell, output = self.create_shell(["help", "quit"])
+    return _make
+
+
+class TestInteractiveShell:
+    def test_help_command(self, make_shell):
+        shell, output = make_shell(["help", "quit"])
         shell.run()
         result = output.getvalue()
 
@@ -31,22 +36,22 @@ class TestInteractiveShell:
         assert "done <id>" in result
         assert "Aliases:" in result
 
-    def test_quit_exits(self):
-        shell, output = self.create_shell(["quit"])
+    def test_quit_exits(self, make_shell):
+        shell, output = make_shell(["quit"])
         shell.run()
         result = output.getvalue()
 
         assert "Goodbye!" in result
 
-    def test_exit_also_works(self):
-        shell, output = self.create_shell(["exit"])
+    def test_exit_also_works(self, make_shell):
+        shell, output = make_shell(["exit"])
         shell.run()
         result = output.getvalue()
 
         assert "Goodbye!" in result
 
-    def test_add_then_list_shows_task(self):
-        shell, output = self.create_shell([
+    def test_add_then_list_shows_task(self, make_shell):
+        shell, output = make_shell([
             'add "Buy groceries"',
             "list",
             "quit",
@@ -58,8 +63,8 @@ class TestInteractiveShell:
         assert "Buy groceries" in result
         assert "[ ]" in result  # open status
 
-    def test_add_with_options(self):
-        shell, output = self.create_shell([
+    def test_add_with_options(self, make_shell):
+        shell, output = make_shell([
             'add "Important task" --priority high --due 2025-12-31 --tag work,urgent',
             "list",
             "quit",
@@ -72,8 +77,8 @@ class TestInteractiveShell:
         assert "2025-12-31" in result
         assert "work" in result
 
-    def test_done_marks_task_complete(self):
-        shell, output = self.create_shell([
+    def test_done_marks_task_complete(self, make_shell):
+        shell, output = make_shell([
             'add "Test task"',
             "done 1",
             "list",
@@ -85,8 +90,8 @@ class TestInteractiveShell:
         assert "Marked task 1 as done" in result
         assert "[x]" in result  # done status
 
-    def test_reopen_marks_task_open(self):
-        shell, output = self.create_shell([
+    def test_reopen_marks_task_open(self, make_shell):
+        shell, output = make_shell([
             'add "Test task"',
             "done 1",
             "reopen 1",
@@ -99,8 +104,8 @@ class TestInteractiveShell:
         assert "Reopened task 1" in result
         assert "[ ]" in result  # open status again
 
-    def test_update_changes_task(self):
-        shell, output = self.create_shell([
+    def test_update_changes_task(self, make_shell):
+        shell, output = make_shell([
             'add "Original title"',
             'update 1 --title "New title"',
             "list",
@@ -112,9 +117,9 @@ class TestInteractiveShell:
         assert "Updated task 1: New title" in result
         assert "New title" in result
 
-    def test_delete_removes_task(self):
+    def test_delete_removes_task(self, make_shell):
         # Use --force to skip confirmation
-        shell, output = self.create_shell([
+        shell, output = make_shell([
             'add "To delete"',
             "delete 1 -f",
             "list",
@@ -126,8 +131,8 @@ class TestInteractiveShell:
         assert "Deleted task 1" in result
         assert "No tasks found" in result
 
-    def test_delete_with_confirmation_yes(self):
-        shell, output = self.create_shell([
+    def test_delete_with_confirmation_yes(self, make_shell):
+        shell, output = make_shell([
             'add "To delete"',
             "delete 1",
             "y",  # Confirm deletion
@@ -140,8 +145,8 @@ class TestInteractiveShell:
         assert "Deleted task 1" in result
         assert "No tasks found" in result
 
-    def test_delete_with_confirmation_no(self):
-        shell, output = self.create_shell([
+    def test_delete_with_confirmation_no(self, make_shell):
+        shell, output = make_shell([
             'add "To keep"',
             "delete 1",
             "n",  # Reject deletion
@@ -154,9 +159,9 @@ class TestInteractiveShell:
         assert "Cancelled." in result
         assert "To keep" in result  # Task still exists
 
-    def test_clear_removes_done_tasks(self):
+    def test_clear_removes_done_tasks(self, make_shell):
         # Use --force to skip confirmation
-        shell, output = self.create_shell([
+        shell, output = make_shell([
             'add "Open task"',
             'add "Done task"',
             "done 2",
@@ -171,8 +176,8 @@ class TestInteractiveShell:
         assert "Open task" in result
         assert "Done task" not in result.split("Cleared")[1]
 
-    def test_clear_with_confirmation_yes(self):
-        shell, output = self.create_shell([
+    def test_clear_with_confirmation_yes(self, make_shell):
+        shell, output = make_shell([
             'add "Done task"',
             "done 1",
             "clear",
@@ -184,8 +189,8 @@ class TestInteractiveShell:
 
         assert "Cleared 1 completed task(s)" in result
 
-    def test_clear_no_done_tasks(self):
-        shell, output = self.create_shell([
+    def test_clear_no_done_tasks(self, make_shell):
+        shell, output = make_shell([
             'add "Open task"',
             "clear",
             "quit",
@@ -197,19 +202,8 @@ class TestInteractiveShell:
 
 
 class TestInteractiveErrorHandling:
-    def create_shell(self, commands: list[str]) -> tuple[InteractiveShell, io.StringIO]:
-        input_stream = io.StringIO("\n".join(commands) + "\n")
-        output_stream = io.StringIO()
-        service = TodoService()
-        shell = InteractiveShell(
-            service=service,
-            input_stream=input_stream,
-            output_stream=output_stream,
-        )
-        return shell, output_stream
-
-    def test_empty_title_error(self):
-        shell, output = self.create_shell([
+    def test_empty_title_error(self, make_shell):
+        shell, output = make_shell([
             'add ""',
             "quit",
         ])
@@ -219,10 +213,10 @@ class TestInteractiveErrorHandling:
         assert "Error: Title cannot be empty" in result
         assert "Goodbye!" in result  # Session continues
 
-    def test_add_guided_prompt_empty_title(self):
+    def test_add_guided_prompt_empty_title(self, make_shell):
         # When add is called without args, it prompts for title
         # If user enters empty string, it should error
-        shell, output = self.create_shell([
+        shell, output = make_shell([
             "add",
             "",  # Empty title in prompt
             "quit",
@@ -233,9 +227,9 @@ class TestInteractiveErrorHandling:
         assert "Title:" in result
         assert "Error: Title cannot be empty" in result
 
-    def test_add_guided_prompt_with_title(self):
+    def test_add_guided_prompt_with_title(self, make_shell):
         # When add is called without args, it prompts for title
-        shell, output = self.create_shell([
+        shell, output = make_shell([
             "add",
             "Prompted task",  # Title in prompt
             "list",
@@ -247,8 +241,8 @@ class TestInteractiveErrorHandling:
         assert "Title:" in result
         assert "Added task 1: Prompted task" in result
 
-    def test_task_not_found_error(self):
-        shell, output = self.create_shell([
+    def test_task_not_found_error(self, make_shell):
+        shell, output = make_shell([
             "done 999",
             "quit",
         ])
@@ -258,8 +252,8 @@ class TestInteractiveErrorHandling:
         assert "Error: Task with id 999 not found" in result
         assert "Goodbye!" in result  # Session continues
 
-    def test_invalid_id_error(self):
-        shell, output = self.create_shell([
+    def test_invalid_id_error(self, make_shell):
+        shell, output = make_shell([
             "done abc",
             "quit",
         ])
@@ -269,8 +263,8 @@ class TestInteractiveErrorHandling:
         assert "Error:" in result
         assert "not a valid task ID" in result
 
-    def test_missing_id_error(self):
-        shell, output = self.create_shell([
+    def test_missing_id_error(self, make_shell):
+        shell, output = make_shell([
             "done",
             "quit",
         ])
@@ -279,8 +273,8 @@ class TestInteractiveErrorHandling:
 
         assert "Error: Task ID is required" in result
 
-    def test_unknown_command(self):
-        shell, output = self.create_shell([
+    def test_unknown_command(self, make_shell):
+        shell, output = make_shell([
             "foobar",
             "quit",
         ])
@@ -290,8 +284,8 @@ class TestInteractiveErrorHandling:
         assert "Unknown command: foobar" in result
         assert "help" in result.lower()
 
-    def test_invalid_date_error(self):
-        shell, output = self.create_shell([
+    def test_invalid_date_error(self, make_shell):
+        shell, output = make_shell([
             'add "Task" --due invalid-date',
             "quit",
         ])
@@ -301,8 +295,8 @@ class TestInteractiveErrorHandling:
         assert "Error:" in result
         assert "Invalid date format" in result
 
-    def test_invalid_priority_in_list(self):
-        shell, output = self.create_shell([
+    def test_invalid_priority_in_list(self, make_shell):
+        shell, output = make_shell([
             "list --status invalid",
             "quit",
         ])
@@ -311,8 +305,8 @@ class TestInteractiveErrorHandling:
 
         assert "Error: Invalid status" in result
 
-    def test_session_continues_after_error(self):
-        shell, output = self.create_shell([
+    def test_session_continues_after_error(self, make_shell):
+        shell, output = make_shell([
             "done 999",  # Error
             'add "Still works"',  # Should work
             "list",
@@ -327,19 +321,8 @@ class TestInteractiveErrorHandling:
 
 
 class TestSessionPersistence:
-    def create_shell(self, commands: list[str]) -> tuple[InteractiveShell, io.StringIO]:
-        input_stream = io.StringIO("\n".join(commands) + "\n")
-        output_stream = io.StringIO()
-        service = TodoService()
-        shell = InteractiveShell(
-            service=service,
-            input_stream=input_stream,
-            output_stream=output_stream,
-        )
-        return shell, output_stream
-
-    def test_multiple_tasks_persist_in_session(self):
-        shell, output = self.create_shell([
+    def test_multiple_tasks_persist_in_session(self, make_shell):
+        shell, output = make_shell([
             'add "Task 1"',
             'add "Task 2"',
             'add "Task 3"',
@@ -353,8 +336,8 @@ class TestSessionPersistence:
         assert "Task 2" in result
         assert "Task 3" in result
 
-    def test_operations_chain_correctly(self):
-        shell, output = self.create_shell([
+    def test_operations_chain_correctly(self, make_shell):
+        shell, output = make_shell([
             'add "Original"',
             'update 1 --title "Modified"',
             "done 1",
@@ -369,8 +352,8 @@ class TestSessionPersistence:
         list_output = [l for l in lines if "Modified" in l and "[x]" in l]
         assert len(list_output) == 1  # Task is both modified and done
 
-    def test_empty_lines_ignored(self):
-        shell, output = self.create_shell([
+    def test_empty_lines_ignored(self, make_shell):
+        shell, output = make_shell([
             "",
             'add "Task"',
             "",
@@ -386,19 +369,8 @@ class TestSessionPersistence:
 
 
 class TestCommandAliases:
-    def create_shell(self, commands: list[str]) -> tuple[InteractiveShell, io.StringIO]:
-        input_stream = io.StringIO("\n".join(commands) + "\n")
-        output_stream = io.StringIO()
-        service = TodoService()
-        shell = InteractiveShell(
-            service=service,
-            input_stream=input_stream,
-            output_stream=output_stream,
-        )
-        return shell, output_stream
-
-    def test_ls_alias_for_list(self):
-        shell, output = self.create_shell([
+    def test_ls_alias_for_list(self, make_shell):
+        shell, output = make_shell([
             'add "Test"',
             "ls",
             "quit",
@@ -409,8 +381,8 @@ class TestCommandAliases:
         assert "Test" in result
         assert "ID" in result  # Table header
 
-    def test_l_alias_for_list(self):
-        shell, output = self.create_shell([
+    def test_l_alias_for_list(self, make_shell):
+        shell, output = make_shell([
             'add "Test"',
             "l",
             "quit",
@@ -420,8 +392,8 @@ class TestCommandAliases:
 
         assert "Test" in result
 
-    def test_a_alias_for_add(self):
-        shell, output = self.create_shell([
+    def test_a_alias_for_add(self, make_shell):
+        shell, output = make_shell([
             'a "Aliased add"',
             "list",
             "quit",
@@ -431,8 +403,8 @@ class TestCommandAliases:
 
         assert "Added task 1: Aliased add" in result
 
-    def test_rm_alias_for_delete(self):
-        shell, output = self.create_shell([
+    def test_rm_alias_for_delete(self, make_shell):
+        shell, output = make_shell([
             'add "To remove"',
             "rm 1 -f",
             "list",
@@ -444,8 +416,8 @@ class TestCommandAliases:
         assert "Deleted task 1" in result
         assert "No tasks found" in result
 
-    def test_d_alias_for_delete(self):
-        shell, output = self.create_shell([
+    def test_d_alias_for_delete(self, make_shell):
+        shell, output = make_shell([
             'add "To delete"',
             "d 1 -f",
             "list",
@@ -456,8 +428,8 @@ class TestCommandAliases:
 
         assert "Deleted task 1" in result
 
-    def test_x_alias_for_done(self):
-        shell, output = self.create_shell([
+    def test_x_alias_for_done(self, make_shell):
+        shell, output = make_shell([
             'add "To complete"',
             "x 1",
             "list",
@@ -469,8 +441,8 @@ class TestCommandAliases:
         assert "Marked task 1 as done" in result
         assert "[x]" in result
 
-    def test_o_alias_for_reopen(self):
-        shell, output = self.create_shell([
+    def test_o_alias_for_reopen(self, make_shell):
+        shell, output = make_shell([
             'add "To reopen"',
             "done 1",
             "o 1",
@@ -483,8 +455,8 @@ class TestCommandAliases:
         assert "Reopened task 1" in result
         assert "[ ]" in result
 
-    def test_u_alias_for_update(self):
-        shell, output = self.create_shell([
+    def test_u_alias_for_update(self, make_shell):
+        shell, output = make_shell([
             'add "Original"',
             'u 1 --title "Updated"',
             "list",
@@ -495,8 +467,8 @@ class TestCommandAliases:
 
         assert "Updated task 1: Updated" in result
 
-    def test_s_alias_for_show(self):
-        shell, output = self.create_shell([
+    def test_s_alias_for_show(self, make_shell):
+        shell, output = make_shell([
             'add "Show me"',
             "s 1",
             "quit",
@@ -507,8 +479,8 @@ class TestCommandAliases:
         assert "Task #1" in result
         assert "Title:    Show me" in result
 
-    def test_question_mark_alias_for_help(self):
-        shell, output = self.create_shell([
+    def test_question_mark_alias_for_help(self, make_shell):
+        shell, output = make_shell([
             "?",
             "quit",
         ])
@@ -518,8 +490,8 @@ class TestCommandAliases:
         assert "Commands:" in result
         assert "Aliases:" in result
 
-    def test_q_alias_for_quit(self):
-        shell, output = self.create_shell([
+    def test_q_alias_for_quit(self, make_shell):
+        shell, output = make_shell([
             "q",
         ])
         shell.run()
@@ -529,19 +501,8 @@ class TestCommandAliases:
 
 
 class TestShowCommand:
-    def create_shell(self, commands: list[str]) -> tuple[InteractiveShell, io.StringIO]:
-        input_stream = io.StringIO("\n".join(commands) + "\n")
-        output_stream = io.StringIO()
-        service = TodoService()
-        shell = InteractiveShell(
-            service=service,
-            input_stream=input_stream,
-            output_stream=output_stream,
-        )
-        return shell, output_stream
-
-    def test_show_displays_task_details(self):
-        shell, output = self.create_shell([
+    def test_show_displays_task_details(self, make_shell):
+        shell, output = make_shell([
             'add "Detailed task" --priority high --due 2025-06-15 --tag work,urgent',
             "show 1",
             "quit",
@@ -557,8 +518,8 @@ class TestShowCommand:
         assert "Tags:     work, urgent" in result
         assert "Created:" in result
 
-    def test_show_task_not_found(self):
-        shell, output = self.create_shell([
+    def test_show_task_not_found(self, make_shell):
+        shell, output = make_shell([
             "show 999",
             "quit",
         ])
@@ -567,8 +528,8 @@ class TestShowCommand:
 
         assert "Error: Task with id 999 not found" in result
 
-    def test_show_with_none_fields(self):
-        shell, output = self.create_shell([
+    def test_show_with_none_fields(self, make_shell):
+        shell, output = make_shell([
             'add "Simple task"',
             "show 1",
             "quit",
@@ -582,20 +543,9 @@ class TestShowCommand:
 
 
 class TestGuidedPrompts:
-    def create_shell(self, commands: list[str]) -> tuple[InteractiveShell, io.StringIO]:
-        input_stream = io.StringIO("\n".join(commands) + "\n")
-        output_stream = io.StringIO()
-        service = TodoService()
-        shell = InteractiveShell(
-            service=service,
-            input_stream=input_stream,
-            output_stream=output_stream,
-        )
-        return shell, output_stream
-
-    def test_update_guided_mode(self):
+    def test_update_guided_mode(self, make_shell):
         # When update is called with ID but no flags, it enters guided mode
-        shell, output = self.create_shell([
+        shell, output = make_shell([
             'add "Original title" --priority low',
             "update 1",
             "New title",  # New title
@@ -612,8 +562,8 @@ class TestGuidedPrompts:
         assert "Title [Original title]:" in result
         assert "Updated task 1: New title" in result
 
-    def test_update_guided_mode_keep_defaults(self):
-        shell, output = self.create_shell([
+    def test_update_guided_mode_keep_defaults(self, make_shell):
+        shell, output = make_shell([
             'add "Keep this"',
             "update 1",
             "",  # Keep title
@@ -631,19 +581,8 @@ class TestGuidedPrompts:
 
 
 class TestForceFlag:
-    def create_shell(self, commands: list[str]) -> tuple[InteractiveShell, io.StringIO]:
-        input_stream = io.StringIO("\n".join(commands) + "\n")
-        output_stream = io.StringIO()
-        service = TodoService()
-        shell = InteractiveShell(
-            service=service,
-            input_stream=input_stream,
-            output_stream=output_stream,
-        )
-        return shell, output_stream
-
-    def test_delete_force_flag_short(self):
-        shell, output = self.create_shell([
+    def test_delete_force_flag_short(self, make_shell):
+        shell, output = make_shell([
             'add "Force delete"',
             "delete 1 -f",
             "quit",
@@ -654,8 +593,8 @@ class TestForceFlag:
         assert "Deleted task 1" in result
         assert "?" not in result  # No confirmation prompt
 
-    def test_delete_force_flag_long(self):
-        shell, output = self.create_shell([
+    def test_delete_force_flag_long(self, make_shell):
+        shell, output = make_shell([
             'add "Force delete"',
             "delete 1 --force",
             "quit",
@@ -665,8 +604,8 @@ class TestForceFlag:
 
         assert "Deleted task 1" in result
 
-    def test_clear_force_flag_short(self):
-        shell, output = self.create_shell([
+    def test_clear_force_flag_short(self, make_shell):
+        shell, output = make_shell([
             'add "Done"',
             "done 1",
             "clear -f",
@@ -678,8 +617,8 @@ class TestForceFlag:
         assert "Cleared 1 completed task(s)" in result
         assert "?" not in result  # No confirmation prompt
 
-    def test_clear_force_flag_long(self):
-        shell, output = self.create_shell([
+    def test_clear_force_flag_long(self, make_shell):
+        shell, output = make_shell([
             'add "Done"',
             "done 1",
             "clear --force",